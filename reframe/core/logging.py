@@ -929,6 +929,12 @@ class LoggerAdapter(logging.LoggerAdapter):
         if self.logger:
             super().log(level, msg, *args, **kwargs)
 
+    def isEnabledFor(self, level):
+        if self.logger:
+            return super().isEnabledFor(level)
+
+        return False
+
     def debug2(self, message, *args, **kwargs):
         self.log(DEBUG2, message, *args, **kwargs)
 
@@ -60,6 +60,14 @@ class JobScheduler(abc.ABC, metaclass=JobSchedulerMeta):
     :meta private:
     '''
 
+    @property
+    def config_prefix(self):
+        '''The configuration prefix of the scheduler-specific options.
+
+        :meta private:
+        '''
+        return self._config_prefix
+
     def get_option(self, name):
         '''Get scheduler-specific option.
 
@@ -144,6 +152,22 @@ class JobScheduler(abc.ABC, metaclass=JobSchedulerMeta):
         :meta private:
         '''
 
+    def block(self, job, timeout):
+        '''Block until the job may have changed state or until the timeout
+        expires.
+
+        This does not update the job state; :func:`poll` must be called for
+        this. Backends that can be notified of job state changes may override
+        this method to return early; the default implementation simply sleeps
+        for the requested amount of time.
+
+        :arg job: A job descriptor.
+        :arg timeout: The maximum time in seconds to block.
+
+        :meta private:
+        '''
+        time.sleep(timeout)
+
     def log(self, message, level=DEBUG2):
         '''Convenience method for logging debug messages from the scheduler
         backends.
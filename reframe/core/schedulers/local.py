@@ -5,6 +5,7 @@
 
 import errno
 import os
+import select
 import signal
 import socket
 import time
@@ -143,6 +144,38 @@ class LocalJobScheduler(sched.JobScheduler):
             self.poll(job)
             time.sleep(self.WAIT_POLL_SECS)
 
+    def block(self, job, timeout):
+        '''Block until the spawned process exits or until the timeout
+        expires.
+
+        The process is not reaped, so that :func:`poll` can retrieve its exit
+        status. If process file descriptors are not supported, this falls
+        back to sleeping for the requested amount of time.
+        '''
+
+        if (job.jobid is None or job.cancel_time or
+            not hasattr(os, 'pidfd_open')):
+            return super().block(job, timeout)
+
+        try:
+            pidfd = os.pidfd_open(job.jobid)
+        except ProcessLookupError:
+            # The process has been reaped already
+            return
+        except OSError:
+            return super().block(job, timeout)
+
+        # Use poll() instead of select(), since the latter cannot handle file
+        # descriptors beyond FD_SETSIZE
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            poller.poll(timeout*1000)
+        except (OSError, ValueError):
+            return super().block(job, timeout)
+        finally:
+            os.close(pidfd)
+
     def finished(self, job):
         '''Check if the spawned process has finished.
 
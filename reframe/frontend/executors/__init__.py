@@ -95,6 +95,10 @@ class TestCase:
         self._deps = []
         self._is_ready = False
 
+        # Test cases are used heavily as dictionary keys by the execution
+        # policies, so we cache their hash value
+        self._hash = None
+
         # Incoming dependencies
         self.in_degree = 0
 
@@ -107,9 +111,12 @@ class TestCase:
         return iter([self._check, self._partition, self._environ])
 
     def __hash__(self):
-        return (hash(self.check.unique_name) ^
-                hash(self.partition.fullname) ^
-                hash(self.environ.name))
+        if self._hash is None:
+            self._hash = (hash(self.check.unique_name) ^
+                          hash(self.partition.fullname) ^
+                          hash(self.environ.name))
+
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
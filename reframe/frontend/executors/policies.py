@@ -3,7 +3,10 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import bisect
+import collections
 import contextlib
+import json
 import math
 import sys
 import time
@@ -15,7 +18,8 @@ from reframe.core.exceptions import (FailureLimitError,
                                      SkipTestError,
                                      TaskDependencyError,
                                      TaskExit)
-from reframe.core.logging import getlogger, level_from_str
+from reframe.core.logging import (getlogger, level_from_str,
+                                  DEBUG2, VERBOSE)
 from reframe.core.pipeline import (CompileOnlyRegressionTest,
                                    RunOnlyRegressionTest)
 from reframe.frontend.executors import (ExecutionPolicy, RegressionTask,
@@ -30,14 +34,48 @@ def _get_partition_name(task, phase='run'):
         return task.check.current_partition.fullname
 
 
+def _sched_poll_key(sched):
+    '''Return a key identifying the schedulers that may poll each other's
+    jobs.
+
+    These are schedulers of the same type sharing the same options.
+    '''
+
+    sched_options = rt.runtime().get_option(sched.config_prefix)
+    return (type(sched), json.dumps(sched_options, sort_keys=True))
+
+
 def _cleanup_all(tasks, *args, **kwargs):
+    # Clean up the tasks that no other task depends on and compact the list
+    # in place with the remaining ones
+    num_kept = 0
     for task in tasks:
         if task.ref_count == 0:
             with contextlib.suppress(TaskExit):
                 task.cleanup(*args, **kwargs)
+        else:
+            tasks[num_kept] = task
+            num_kept += 1
+
+    del tasks[num_kept:]
+
+
+def _release_deps(task, task_index):
+    '''Decrease the reference count of the dependencies of a task.
+
+    Return :obj:`True` if any of the dependencies can now be cleaned up.
+    '''
+
+    released = False
+    for c in task.testcase.deps:
+        # NOTE: Restored dependencies are not in the task_index
+        if c in task_index:
+            dep = task_index[c]
+            dep.ref_count -= 1
+            if dep.ref_count == 0:
+                released = True
 
-    # Remove cleaned up tests
-    tasks[:] = [t for t in tasks if t.ref_count]
+    return released
 
 
 def _print_perf(task):
@@ -54,34 +92,120 @@ def _print_perf(task):
                         f'(r:{info[1]}, l:{info[2]}, u:{info[3]})')
 
 
+def _log_timings(task):
+    # Avoid collecting the timings if they are not going to be logged
+    if getlogger().isEnabledFor(VERBOSE):
+        getlogger().verbose(f'==> {task.pipeline_timings_all()}')
+
+
 class _PollController:
-    SLEEP_MIN = 0.1
     SLEEP_MAX = 10
-    SLEEP_INC_RATE = 1.1
+
+    # Minimum number of observed completion times required before switching
+    # from the geometric backoff to the adaptive poll schedule
+    MIN_SAMPLES = 8
+
+    # Quantile of the observed completion times up to which polls are placed
+    # adaptively; beyond that we fall back to the geometric backoff
+    MAX_QUANTILE = 0.99
 
     def __init__(self):
+        self._sleep_min = rt.runtime().get_option('general/0/poll_backoff_min')
+        self._sleep_inc_rate = rt.runtime().get_option(
+            'general/0/poll_backoff_base'
+        )
         self._num_polls = 0
         self._sleep_duration = None
         self._t_init = None
+        self._t_reset = None
+
+        # Sorted list of the observed completion times
+        self._samples = []
+
+        # Poll points relative to the last reset; these are computed lazily
+        # from the observed completion times
+        self._poll_points = None
+
+    def record_completion(self, duration):
+        '''Record the completion time of a job.
+
+        The adaptive poll points are measured from the last reset, so this
+        must only be used if the polls following a reset concern a single job
+        that was submitted at the time of the reset.
+        '''
+
+        if duration is None:
+            return
+
+        bisect.insort(self._samples, duration)
+        self._poll_points = None
+
+    def _quantile(self, q):
+        idx = min(int(q * len(self._samples)), len(self._samples) - 1)
+        return self._samples[idx]
+
+    def _compute_poll_points(self):
+        # Place the poll points so that each interval between them covers the
+        # same probability mass of the observed completion times; polls are
+        # thus denser where completions are more likely. Enough points are
+        # used so as to cover the upper quantile with intervals not exceeding
+        # on average the maximum sleep duration.
+        t_upper = self._quantile(self.MAX_QUANTILE)
+        num_points = max(self.MIN_SAMPLES, math.ceil(t_upper/self.SLEEP_MAX))
+        points = []
+        for i in range(1, num_points + 1):
+            t = self._quantile(i * self.MAX_QUANTILE / num_points)
+            if not points or t > points[-1]:
+                points.append(t)
+
+        return points
+
+    def _next_sleep_duration(self):
+        backoff = min(self._sleep_duration*self._sleep_inc_rate,
+                      self.SLEEP_MAX)
+        if len(self._samples) < self.MIN_SAMPLES:
+            return backoff
+
+        if self._poll_points is None:
+            self._poll_points = self._compute_poll_points()
+
+        t_since_reset = time.time() - self._t_reset
+        idx = bisect.bisect_right(self._poll_points, t_since_reset)
+        if idx == len(self._poll_points):
+            return backoff
+
+        return max(self._sleep_min,
+                   min(self._poll_points[idx] - t_since_reset, self.SLEEP_MAX))
 
     def reset_snooze_time(self):
-        self._sleep_duration = self.SLEEP_MIN
+        self._sleep_duration = self._sleep_min
+        self._t_reset = time.time()
+
+    def snooze(self, wait=None):
+        '''Sleep until the next poll.
+
+        If `wait` is given, it will be called with the sleep duration instead
+        of sleeping; this allows callers to return early when woken up.
+        '''
 
-    def snooze(self):
         if self._num_polls == 0:
             self._t_init = time.time()
 
-        t_elapsed = time.time() - self._t_init
         self._num_polls += 1
-        poll_rate = self._num_polls / t_elapsed if t_elapsed else math.inf
-        getlogger().debug2(
-            f'Poll rate control: sleeping for {self._sleep_duration}s '
-            f'(current poll rate: {poll_rate} polls/s)'
-        )
-        time.sleep(self._sleep_duration)
-        self._sleep_duration = min(
-            self._sleep_duration*self.SLEEP_INC_RATE, self.SLEEP_MAX
-        )
+        if getlogger().isEnabledFor(DEBUG2):
+            t_elapsed = time.time() - self._t_init
+            poll_rate = self._num_polls / t_elapsed if t_elapsed else math.inf
+            getlogger().debug2(
+                f'Poll rate control: sleeping for {self._sleep_duration}s '
+                f'(current poll rate: {poll_rate} polls/s)'
+            )
+
+        if wait:
+            wait(self._sleep_duration)
+        else:
+            time.sleep(self._sleep_duration)
+
+        self._sleep_duration = self._next_sleep_duration()
 
 
 class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
@@ -99,7 +223,7 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
 
     def runcase(self, case):
         super().runcase(case)
-        check, partition, _ = case
+        check, partition, environ = case
         task = RegressionTask(case, self.task_listeners)
         if check.is_dry_run():
             self.printer.status('DRY', task.info())
@@ -126,8 +250,7 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
                     task.skip()
                     raise TaskExit from e
 
-            task.setup(task.testcase.partition,
-                       task.testcase.environ,
+            task.setup(partition, environ,
                        sched_flex_alloc_nodes=self.sched_flex_alloc_nodes,
                        sched_options=self.sched_options)
             task.compile()
@@ -148,7 +271,9 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
                 if task.run_complete():
                     break
 
-                self._pollctl.snooze()
+                self._pollctl.snooze(
+                    lambda timeout: sched.block(task.check.job, timeout)
+                )
 
             task.run_wait()
             if not self.skip_sanity_check:
@@ -177,7 +302,7 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
         pass
 
     def on_task_exit(self, task):
-        pass
+        self._pollctl.record_completion(task.duration('run_complete'))
 
     def on_task_compile_exit(self, task):
         pass
@@ -203,15 +328,9 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
             # Dry-run the performance stage to trigger performance logging
             task.performance(dry_run=True)
 
-        timings = task.pipeline_timings(['setup',
-                                         'compile_complete',
-                                         'run_complete',
-                                         'sanity',
-                                         'performance',
-                                         'total'])
         getlogger().info(f'==> test failed during {task.failed_stage!r}: '
                          f'test staged in {task.check.stagedir!r}')
-        getlogger().verbose(f'==> {timings}')
+        _log_timings(task)
         if self._num_failed_tasks >= self.max_failures:
             raise FailureLimitError(
                 f'maximum number of failures ({self.max_failures}) reached'
@@ -224,21 +343,14 @@ class SerialExecutionPolicy(ExecutionPolicy, TaskEventListener):
         msg = f'{task.info()}'
         self.printer.status('OK', msg, just='right')
         _print_perf(task)
-        timings = task.pipeline_timings(['setup',
-                                         'compile_complete',
-                                         'run_complete',
-                                         'sanity',
-                                         'performance',
-                                         'total'])
-        getlogger().verbose(f'==> {timings}')
-
-        # Update reference count of dependencies
-        for c in task.testcase.deps:
-            # NOTE: Restored dependencies are not in the task_index
-            if c in self._task_index:
-                self._task_index[c].ref_count -= 1
+        _log_timings(task)
+
+        # Update reference count of dependencies and clean up the tasks that
+        # are no more needed, if any
+        released = _release_deps(task, self._task_index)
+        if released or task.ref_count == 0:
+            _cleanup_all(self._retired_tasks, not self.keep_stage_files)
 
-        _cleanup_all(self._retired_tasks, not self.keep_stage_files)
         if self.timeout_expired():
             raise RunSessionTimeout('maximum session duration exceeded')
 
@@ -262,20 +374,47 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         # we want to preserve the order of the tasks.
         self._current_tasks = util.OrderedSet()
 
-        # Quick look up for the partition schedulers including the
-        # `_rfm_local` pseudo-partition
-        self._schedulers = {
-            '_rfm_local': self.local_scheduler
+        # The subset of the current tasks that are advanced in the pipeline;
+        # tasks waiting for their dependencies to finish are added here only
+        # once they can make progress
+        self._active_tasks = util.OrderedSet()
+
+        # Partitions grouped by schedulers that may poll each other's jobs,
+        # including the `_rfm_local` pseudo-partition; this allows us to poll
+        # all the jobs of a group with a single scheduler call
+        self._poll_groups = {
+            _sched_poll_key(self.local_scheduler): (self.local_scheduler,
+                                                    ['_rfm_local'])
         }
 
-        # Tasks per partition
+        # Tasks per partition indexed by their stage; only the tasks that are
+        # currently compiling or running are tracked here
         self._partition_tasks = {
-            '_rfm_local': util.OrderedSet()
+            '_rfm_local': self._make_stage_index()
         }
 
+        # Total number of compiling or running tasks across all partitions
+        self._num_running_tasks = 0
+
         # Retired tasks that need to be cleaned up
         self._retired_tasks = []
 
+        # Set when some of the retired tasks may be cleaned up
+        self._cleanup_pending = False
+
+        # Partition names of the tasks per phase; these are queried on every
+        # step, so we cache them from the first time they are needed until
+        # the task is removed
+        self._task_partnames = {}
+
+        # Tasks waiting on each task to finish
+        self._waiters = {}
+
+        # Number of pending, failed and skipped dependencies per task; these
+        # are updated as soon as the dependencies finish, so that waiting
+        # tasks do not need to inspect all of their dependencies
+        self._deps_status = {}
+
         # Job limit per partition
         self._max_jobs = {
             '_rfm_local': rt.runtime().get_option('systems/0/max_local_jobs')
@@ -283,6 +422,16 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         self._pipeline_statistics = rt.runtime().get_option(
             'general/0/dump_pipeline_progress'
         )
+
+        # Functions for advancing the tasks per state
+        self._advance_funcs = {
+            'startup': self._advance_startup,
+            'ready_compile': self._advance_ready_compile,
+            'compiling': self._advance_compiling,
+            'ready_run': self._advance_ready_run,
+            'running': self._advance_running,
+            'completing': self._advance_completing
+        }
         self.task_listeners.append(self)
 
     def _init_pipeline_progress(self, num_tasks):
@@ -324,42 +473,49 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
     def runcase(self, case):
         super().runcase(case)
         check, partition, environ = case
-        self._schedulers[partition.fullname] = partition.scheduler
-
-        # Set partition-based counters, if not set already
-        self._partition_tasks.setdefault(partition.fullname, util.OrderedSet())
-        self._max_jobs.setdefault(partition.fullname, partition.max_jobs)
+        partname = partition.fullname
+        if partname not in self._partition_tasks:
+            # Set partition-based counters
+            self._partition_tasks[partname] = self._make_stage_index()
+            self._max_jobs[partname] = partition.max_jobs
+
+            sched = partition.scheduler
+            _, partnames = self._poll_groups.setdefault(
+                _sched_poll_key(sched), (sched, [])
+            )
+            partnames.append(partname)
 
         task = RegressionTask(case, self.task_listeners)
         self._task_index[case] = task
         self.stats.add_task(task)
+        self._register_deps(task)
         getlogger().debug2(
-            f'Added {check.name} on {partition.fullname} '
-            f'using {environ.name}'
+            f'Added {check.name} on {partname} using {environ.name}'
         )
         self._current_tasks.add(task)
+        if self._deps_resolved(task):
+            self._active_tasks.add(task)
 
     def exit(self):
         if self._pipeline_statistics:
             self._init_pipeline_progress(len(self._current_tasks))
 
+        self._prioritize_tasks()
         self._pollctl.reset_snooze_time()
+        timeout = rt.runtime().get_option('general/0/pipeline_timeout')
         while self._current_tasks:
             try:
                 self._poll_tasks()
-                num_running = sum(
-                    1 if t.state in ('running', 'compiling') else 0
-                    for t in self._current_tasks
-                )
-                timeout = rt.runtime().get_option(
-                    'general/0/pipeline_timeout'
-                )
-
-                self._advance_all(self._current_tasks, timeout)
+                num_running = self._num_running_tasks
+                self._advance_all(self._active_tasks, timeout)
                 if self._pipeline_statistics:
                     num_retired = len(self._retired_tasks)
 
-                _cleanup_all(self._retired_tasks, not self.keep_stage_files)
+                if self._cleanup_pending:
+                    self._cleanup_pending = False
+                    _cleanup_all(self._retired_tasks,
+                                 not self.keep_stage_files)
+
                 if self._pipeline_statistics:
                     num_retired_actual = num_retired - len(self._retired_tasks)
 
@@ -388,15 +544,15 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         if self.dry_run_mode:
             return
 
-        for partname, sched in self._schedulers.items():
+        for sched, partnames in self._poll_groups.values():
             jobs = []
-            for t in self._partition_tasks[partname]:
-                if t.state == 'compiling':
-                    jobs.append(t.check.build_job)
-                elif t.state == 'running':
-                    jobs.append(t.check.job)
+            for p in partnames:
+                tasks = self._partition_tasks[p]
+                jobs += [t.check.build_job for t in tasks['compiling']]
+                jobs += [t.check.job for t in tasks['running']]
 
-            sched.poll(*jobs)
+            if jobs:
+                sched.poll(*jobs)
 
     def _exec_stage(self, task, stage_methods):
         '''Execute a series of pipeline stages.
@@ -408,22 +564,82 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
             for stage in stage_methods:
                 stage()
         except TaskExit:
-            self._current_tasks.remove(task)
+            self._remove_task(task)
             if task.check.current_partition:
                 partname = task.check.current_partition.fullname
             else:
                 partname = None
 
             # Remove tasks from the partition tasks if there
-            with contextlib.suppress(KeyError):
-                self._partition_tasks['_rfm_local'].remove(task)
-                if partname:
-                    self._partition_tasks[partname].remove(task)
+            self._discard_partition_task('_rfm_local', task)
+            if partname:
+                self._discard_partition_task(partname, task)
 
             return False
         else:
             return True
 
+    def _cached_partname(self, task, phase='run'):
+        try:
+            return self._task_partnames[task, phase]
+        except KeyError:
+            partname = _get_partition_name(task, phase)
+            self._task_partnames[task, phase] = partname
+            return partname
+
+    def _prioritize_tasks(self):
+        '''Order the active tasks by the length of their longest chain of
+        dependent tasks.
+
+        This way, tasks on the critical path of the dependency graph are
+        admitted first when the job slots are limited.
+        '''
+
+        # The current tasks are topologically sorted, so visiting them in
+        # reverse order guarantees that the dependent tasks of each task have
+        # already been visited
+        priority = {}
+        for t in reversed(list(self._current_tasks)):
+            priority[t] = 1 + max(
+                (priority.get(w, 0) for w in self._waiters.get(t, [])),
+                default=0
+            )
+
+        self._active_tasks = util.OrderedSet(
+            sorted(self._active_tasks, key=lambda t: priority[t], reverse=True)
+        )
+
+    def _remove_task(self, task):
+        self._current_tasks.remove(task)
+        self._active_tasks.discard(task)
+        self._task_partnames.pop((task, 'build'), None)
+        self._task_partnames.pop((task, 'run'), None)
+
+    @staticmethod
+    def _make_stage_index():
+        return {
+            'compiling': util.OrderedSet(),
+            'running': util.OrderedSet()
+        }
+
+    def _num_partition_tasks(self, partname):
+        return sum(len(tasks)
+                   for tasks in self._partition_tasks[partname].values())
+
+    def _add_partition_task(self, partname, stage, task):
+        self._partition_tasks[partname][stage].add(task)
+        self._num_running_tasks += 1
+
+    def _remove_partition_task(self, partname, stage, task):
+        self._partition_tasks[partname][stage].remove(task)
+        self._num_running_tasks -= 1
+
+    def _discard_partition_task(self, partname, task):
+        for tasks in self._partition_tasks[partname].values():
+            if task in tasks:
+                tasks.remove(task)
+                self._num_running_tasks -= 1
+
     def _advance_all(self, tasks, timeout=None):
         t_init = time.time()
         num_progressed = 0
@@ -434,15 +650,15 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         # since the tasks may removed by the individual advance functions.
         for t in list(tasks):
             old_state = t.state
-            bump_state = getattr(self, f'_advance_{t.state}')
-            num_progressed += bump_state(t)
+            num_progressed += self._advance_funcs[old_state](t)
             new_state = t.state
 
             if self._pipeline_statistics:
                 self._update_pipeline_progress(old_state, new_state, 1)
 
-            t_elapsed = time.time() - t_init
-            if timeout and t_elapsed > timeout and num_progressed:
+            # Query the time only if we may actually stop here
+            if (timeout and num_progressed and
+                time.time() - t_init > timeout):
                 break
 
         getlogger().debug2(f'Bumped {num_progressed} test(s)')
@@ -453,7 +669,7 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
                 raise SkipTestError('skipped due to skipped dependencies')
             except SkipTestError as e:
                 task.skip()
-                self._current_tasks.remove(task)
+                self._remove_task(task)
                 return 1
         elif self.deps_succeeded(task):
             try:
@@ -467,7 +683,7 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
                            sched_flex_alloc_nodes=self.sched_flex_alloc_nodes,
                            sched_options=self.sched_options)
             except TaskExit:
-                self._current_tasks.remove(task)
+                self._remove_task(task)
                 return 1
 
             if isinstance(task.check, RunOnlyRegressionTest):
@@ -478,34 +694,37 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
                                         task.compile_wait])
 
             return 1
-        elif self.deps_failed(task):
+        else:
+            # Only tasks with resolved dependencies are active, so some of
+            # the dependencies of this task must have failed
+            assert self.deps_failed(task)
             exc = TaskDependencyError('dependencies failed')
             task.fail((type(exc), exc, None))
-            self._current_tasks.remove(task)
+            self._remove_task(task)
             return 1
-        else:
-            # Not all dependencies have finished yet
-            getlogger().debug2(f'{task.info()} waiting for dependencies')
-            return 0
 
     def _advance_ready_compile(self, task):
-        partname = _get_partition_name(task, phase='build')
+        partname = self._cached_partname(task, phase='build')
         max_jobs = self._max_jobs[partname]
-        if len(self._partition_tasks[partname]) < max_jobs:
+        if self._num_partition_tasks(partname) < max_jobs:
             if self._exec_stage(task, [task.compile]):
-                self._partition_tasks[partname].add(task)
+                self._add_partition_task(partname, 'compiling', task)
 
             return 1
 
-        getlogger().debug2(f'Hit the max job limit of {partname}: {max_jobs}')
+        if getlogger().isEnabledFor(DEBUG2):
+            getlogger().debug2(
+                f'Hit the max job limit of {partname}: {max_jobs}'
+            )
+
         return 0
 
     def _advance_compiling(self, task):
-        partname = _get_partition_name(task, phase='build')
+        partname = self._cached_partname(task, phase='build')
         try:
             if task.compile_complete():
                 task.compile_wait()
-                self._partition_tasks[partname].remove(task)
+                self._remove_partition_task(partname, 'compiling', task)
                 if isinstance(task.check, CompileOnlyRegressionTest):
                     # All tests should pass from all the pipeline stages,
                     # even if they are no-ops
@@ -517,35 +736,39 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
             else:
                 return 0
         except TaskExit:
-            self._partition_tasks[partname].remove(task)
-            self._current_tasks.remove(task)
+            self._remove_partition_task(partname, 'compiling', task)
+            self._remove_task(task)
             return 1
 
     def _advance_ready_run(self, task):
-        partname = _get_partition_name(task, phase='run')
+        partname = self._cached_partname(task, phase='run')
         max_jobs = self._max_jobs[partname]
-        if len(self._partition_tasks[partname]) < max_jobs:
+        if self._num_partition_tasks(partname) < max_jobs:
             if self._exec_stage(task, [task.run]):
-                self._partition_tasks[partname].add(task)
+                self._add_partition_task(partname, 'running', task)
 
             return 1
 
-        getlogger().debug2(f'Hit the max job limit of {partname}: {max_jobs}')
+        if getlogger().isEnabledFor(DEBUG2):
+            getlogger().debug2(
+                f'Hit the max job limit of {partname}: {max_jobs}'
+            )
+
         return 0
 
     def _advance_running(self, task):
-        partname = _get_partition_name(task, phase='run')
+        partname = self._cached_partname(task, phase='run')
         try:
             if task.run_complete():
                 if self._exec_stage(task, [task.run_wait]):
-                    self._partition_tasks[partname].remove(task)
+                    self._remove_partition_task(partname, 'running', task)
 
                 return 1
             else:
                 return 0
         except TaskExit:
-            self._partition_tasks[partname].remove(task)
-            self._current_tasks.remove(task)
+            self._remove_partition_task(partname, 'running', task)
+            self._remove_task(task)
             return 1
 
     def _advance_completing(self, task):
@@ -558,26 +781,64 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
 
             task.finalize()
             self._retired_tasks.append(task)
-            self._current_tasks.remove(task)
+            self._remove_task(task)
             return 1
         except TaskExit:
-            self._current_tasks.remove(task)
+            self._remove_task(task)
             return 1
 
+    def _register_deps(self, task):
+        status = collections.Counter()
+        for c in task.testcase.deps:
+            # NOTE: Restored dependencies are not in the task_index. Any
+            # other dependency is expected to be there already, since the
+            # test cases are passed to `runcase()` in topological order; if
+            # not, it would be wrongly treated as restored and the task could
+            # start before it has finished.
+            if c not in self._task_index:
+                continue
+
+            dep = self._task_index[c]
+            if dep.skipped:
+                status['skipped'] += 1
+            elif dep.failed:
+                status['failed'] += 1
+            elif not dep.succeeded:
+                status['pending'] += 1
+                self._waiters.setdefault(dep, []).append(task)
+
+        self._deps_status[task] = status
+
+    def _resolve_dep(self, task, outcome):
+        '''Notify the tasks waiting on `task` that it has finished.'''
+
+        for waiter in self._waiters.pop(task, []):
+            status = self._deps_status[waiter]
+            status['pending'] -= 1
+            if outcome != 'succeeded':
+                status[outcome] += 1
+
+            if (waiter in self._current_tasks and
+                self._deps_resolved(waiter)):
+                self._active_tasks.add(waiter)
+
+    def _deps_resolved(self, task):
+        '''Check if the outcome of the dependencies of `task` is known.'''
+
+        status = self._deps_status[task]
+        return (status['pending'] == 0 or
+                status['failed'] > 0 or status['skipped'] > 0)
+
     def deps_failed(self, task):
-        # NOTE: Restored dependencies are not in the task_index
-        return any(self._task_index[c].failed
-                   for c in task.testcase.deps if c in self._task_index)
+        return self._deps_status[task]['failed'] > 0
 
     def deps_succeeded(self, task):
-        # NOTE: Restored dependencies are not in the task_index
-        return all(self._task_index[c].succeeded
-                   for c in task.testcase.deps if c in self._task_index)
+        status = self._deps_status[task]
+        return not (status['pending'] or status['failed'] or
+                    status['skipped'])
 
     def deps_skipped(self, task):
-        # NOTE: Restored dependencies are not in the task_index
-        return any(self._task_index[c].skipped
-                   for c in task.testcase.deps if c in self._task_index)
+        return self._deps_status[task]['skipped'] > 0
 
     def _abortall(self, cause):
         '''Mark all tests as failures'''
@@ -605,6 +866,7 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         self._pollctl.reset_snooze_time()
 
     def on_task_skip(self, task):
+        self._resolve_dep(task, 'skipped')
         msg = f'{task.info()} [{task.exc_info[1]}]'
         self.printer.status('SKIP', msg, just='right')
 
@@ -613,6 +875,7 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
         self.printer.status('ABORT', msg, just='right')
 
     def on_task_failure(self, task):
+        self._resolve_dep(task, 'failed')
         self._num_failed_tasks += 1
         msg = f'{task.info()}'
         if task.failed_stage == 'cleanup':
@@ -625,32 +888,20 @@ class AsynchronousExecutionPolicy(ExecutionPolicy, TaskEventListener):
             # Dry-run the performance stage to trigger performance logging
             task.performance(dry_run=True)
 
-        timings = task.pipeline_timings(['setup',
-                                         'compile_complete',
-                                         'run_complete',
-                                         'sanity',
-                                         'performance',
-                                         'total'])
         getlogger().info(f'==> test failed during {task.failed_stage!r}: '
                          f'test staged in {task.check.stagedir!r}')
-        getlogger().verbose(f'==> {timings}')
+        _log_timings(task)
         if self._num_failed_tasks >= self.max_failures:
             raise FailureLimitError(
                 f'maximum number of failures ({self.max_failures}) reached'
             )
 
     def on_task_success(self, task):
+        self._resolve_dep(task, 'succeeded')
         msg = f'{task.info()}'
         self.printer.status('OK', msg, just='right')
         _print_perf(task)
-        timings = task.pipeline_timings(['setup',
-                                         'compile_complete',
-                                         'run_complete',
-                                         'sanity',
-                                         'performance',
-                                         'total'])
-        getlogger().verbose(f'==> {timings}')
-        for c in task.testcase.deps:
-            # NOTE: Restored dependencies are not in the task_index
-            if c in self._task_index:
-                self._task_index[c].ref_count -= 1
+        _log_timings(task)
+        released = _release_deps(task, self._task_index)
+        if released or task.ref_count == 0:
+            self._cleanup_pending = True
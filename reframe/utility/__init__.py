@@ -14,6 +14,7 @@ import itertools
 import os
 import re
 import sys
+import threading
 import types
 import weakref
 
@@ -21,10 +22,15 @@ import reframe
 
 from ClusterShell.NodeSet import NodeSet, NodeSetParseError
 from collections import UserDict
-from hashlib import sha256
+from hashlib import blake2b
 from . import typecheck as typ
 
 
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+_NONALNUM_RE = re.compile(r'\W')
+_SITE_PACKAGES_RE = re.compile(r'.*(site|dist)-packages/(?P<rel_filename>.+)')
+
+
 def seconds_to_hms(seconds):
     '''Convert time in seconds to hours, minutes and seconds.
 
@@ -55,6 +61,11 @@ def _get_module_name(filename):
         return barename.replace(os.sep, '.')
 
 
+# Names of the modules loaded by `import_module_from_file()` keyed by the
+# expanded filename and the parent module
+_resolved_modules = {}
+
+
 def _do_import_module_from_file(filename, module_name=None):
     module_name = module_name or _get_module_name(filename)
     if module_name in sys.modules:
@@ -98,6 +109,14 @@ def import_module_from_file(filename, force=False, parent=None):
 
     # Expand and sanitize filename
     filename = os.path.abspath(os.path.expandvars(filename))
+
+    # Skip the module name resolution if we have already loaded this file
+    cache_key = (filename, parent)
+    if not force and cache_key in _resolved_modules:
+        module = sys.modules.get(_resolved_modules[cache_key])
+        if module is not None:
+            return module
+
     if os.path.isdir(filename):
         filename = os.path.join(filename, '__init__.py')
 
@@ -110,24 +129,28 @@ def import_module_from_file(filename, force=False, parent=None):
         # the name that we assign to the module, in order to avoid clashes
         # with other modules loaded with a standard `import` or with multiple
         # test files with the same name that reside in different directories.
-        module_hash = sha256(filename.encode('utf-8')).hexdigest()[:8]
+        module_hash = blake2b(filename.encode('utf-8'),
+                              digest_size=4).hexdigest()
         if parent:
             module_name = f'{parent}.{module_name}'
 
         module_name = f'{module_name}@{module_hash}'
-        return _do_import_module_from_file(filename, module_name)
+        module = _do_import_module_from_file(filename, module_name)
+        _resolved_modules[cache_key] = module_name
+        return module
 
     # Extract module name if `filename` is under `site-packages/` or the
     # Debian specific `dist-packages/`
-    site_packages = re.compile(r'.*(site|dist)-packages/(?P<rel_filename>.+)')
-    match = site_packages.search(filename)
+    match = _SITE_PACKAGES_RE.search(filename)
     if match:
         module_name = _get_module_name(match['rel_filename'])
 
     if force:
         sys.modules.pop(module_name, None)
 
-    return importlib.import_module(module_name)
+    module = importlib.import_module(module_name)
+    _resolved_modules[cache_key] = module_name
+    return module
 
 
 def import_module(module_name, force=False):
@@ -145,18 +168,10 @@ def import_module(module_name, force=False):
     '''
 
     # Calculate the number of levels that we need to go up
-    for num_dots, c in enumerate(module_name):
-        if c != '.':
-            break
-
-    if num_dots:
-        prefix = './'
-        for i in range(num_dots-1):
-            prefix += '../'
-    else:
-        prefix = ''
-
-    path = prefix + module_name.lstrip('.').replace('.', '/')
+    barename = module_name.lstrip('.')
+    num_dots = len(module_name) - len(barename)
+    prefix = './' + '../' * (num_dots - 1) if num_dots else ''
+    path = prefix + barename.replace('.', '/')
     if os.path.isdir(path):
         path += '/__init__.py'
     else:
@@ -183,6 +198,10 @@ def allx(iterable):
     :class:`False` if ``iterable`` is empty.
     '''
 
+    # Fast path for the most common builtin containers
+    if type(iterable) in (list, tuple, set, frozenset):
+        return bool(iterable) and all(iterable)
+
     # Generators must be treated specially, because there is no way to get
     # their size without consuming their elements.
     if isinstance(iterable, types.GeneratorType):
@@ -217,7 +236,10 @@ def decamelize(s, delim='_'):
     if not s:
         return ''
 
-    return re.sub(r'([a-z])([A-Z])', r'\1%s\2' % delim, s).lower()
+    if s.islower():
+        return s
+
+    return _CAMEL_RE.sub(r'\1%s\2' % delim, s).lower()
 
 
 def toalphanum(s):
@@ -233,10 +255,10 @@ def toalphanum(s):
     if not isinstance(s, str):
         raise TypeError('toalphanum() requires a string argument')
 
-    if not s:
-        return ''
+    if not s or s.isalnum():
+        return s
 
-    return re.sub(r'\W', '_', s)
+    return _NONALNUM_RE.sub('_', s)
 
 
 def ppretty(value, htchar=' ', lfchar='\n', indent=4, basic_offset=0,
@@ -260,66 +282,90 @@ def ppretty(value, htchar=' ', lfchar='\n', indent=4, basic_offset=0,
 
     '''
 
-    ppretty2 = functools.partial(
-        ppretty, htchar=htchar, lfchar=lfchar, indent=indent,
-        basic_offset=basic_offset+1, repr=repr
-    )
-    nlch = lfchar + htchar * indent * (basic_offset + 1)
-    if isinstance(value, tuple):
-        if value == ():
-            return '()'
-
-        items = [nlch + ppretty2(item) for item in value]
-        return '(%s)' % (','.join(items) + lfchar +
-                         htchar * indent * basic_offset)
-    elif isinstance(value, list):
-        if value == []:
-            return '[]'
-
-        items = [
-            nlch + ppretty2(item)
-            for item in value
-        ]
-        return '[%s]' % (','.join(items) + lfchar +
-                         htchar * indent * basic_offset)
-    elif isinstance(value, dict):
-        if value == {}:
-            return '{}'
-
-        items = [
-            nlch + repr(key) + ': ' + ppretty2(value[key]) for key in value
-        ]
-        return '{%s}' % (','.join(items) + lfchar +
-                         htchar * indent * basic_offset)
-    elif isinstance(value, set):
-        if value == set():
-            return 'set()'
-
-        items = [nlch + ppretty2(item) for item in value]
-        return '{%s}' % (','.join(items) + lfchar +
-                         htchar * indent * basic_offset)
-    else:
-        try:
-            return repr(value, htchar, lfchar, indent, basic_offset)
-        except TypeError:
-            # Not our custom repr()
-            return repr(value)
+    # Format the value iteratively to avoid deep recursion on large nested
+    # containers; the stack holds either literal strings to be emitted or
+    # `(value, offset)` pairs to be formatted. A `None` offset denotes a
+    # dictionary key.
+    newlines = {}
+
+    def _newline(offset):
+        if offset not in newlines:
+            newlines[offset] = lfchar + htchar * indent * offset
+
+        return newlines[offset]
+
+    out = []
+    stack = [(value, basic_offset)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+            continue
+
+        value, offset = item
+        if offset is None:
+            out.append(repr(value) + ': ')
+            continue
+
+        if isinstance(value, tuple):
+            brackets = '()'
+        elif isinstance(value, list):
+            brackets = '[]'
+        elif isinstance(value, (dict, set)):
+            brackets = '{}'
+        else:
+            try:
+                out.append(repr(value, htchar, lfchar, indent, offset))
+            except TypeError:
+                # Not our custom repr()
+                out.append(repr(value))
+
+            continue
+
+        if not value:
+            out.append('set()' if isinstance(value, set) else brackets)
+            continue
+
+        sep = ',' + _newline(offset + 1)
+        tokens = []
+        if isinstance(value, dict):
+            for key, val in value.items():
+                tokens += [sep, (key, None), (val, offset + 1)]
+        else:
+            for val in value:
+                tokens += [sep, (val, offset + 1)]
+
+        tokens[0] = brackets[0] + sep[1:]
+        tokens.append(_newline(offset) + brackets[1])
+        stack += reversed(tokens)
+
+    return ''.join(out)
 
 
 def _tracked_repr(func):
-    objects = set()
+    # The objects visited are tracked per thread and per top-level call
+    state = threading.local()
 
     @functools.wraps(func)
     def _repr(obj, *args, **kwargs):
-        addr = id(obj)
-        if addr in objects:
-            return f'{type(obj).__name__}(...)@{hex(addr)}'
+        objects = getattr(state, 'objects', None)
+        toplevel = objects is None
+        if toplevel:
+            objects = state.objects = set()
 
-        # Do not track builtin objects
-        if hasattr(obj, '__dict__'):
-            objects.add(addr)
+        try:
+            addr = id(obj)
+            if addr in objects:
+                return f'{type(obj).__name__}(...)@{hex(addr)}'
 
-        return func(obj, *args, **kwargs)
+            # Do not track builtin objects
+            if hasattr(obj, '__dict__'):
+                objects.add(addr)
+
+            return func(obj, *args, **kwargs)
+        finally:
+            if toplevel:
+                state.objects = None
 
     return _repr
 
@@ -366,12 +412,14 @@ def attrs(obj):
     :meta private:
     '''
 
-    ret = dict(obj.__dict__)
+    ret = obj.__dict__.copy()
 
-    # Look for descriptors
-    for cls in type(obj).mro():
-        for attr in cls.__dict__:
-            if inspect.isdatadescriptor(cls.__dict__[attr]):
+    # Look for data descriptors
+    for cls in type(obj).__mro__:
+        for attr, value in cls.__dict__.items():
+            value_type = type(value)
+            if (hasattr(value_type, '__set__') or
+                hasattr(value_type, '__delete__')):
                 try:
                     ret[attr] = getattr(obj, attr)
                 except AttributeError:
@@ -404,27 +452,36 @@ def is_trivially_callable(fn, *, non_def_args=0):
     if not callable(fn):
         raise TypeError('argument is not a callable')
 
-    explicit_args = [p for p in inspect.signature(fn).parameters.values()
-                     if p.default is p.empty]
-    return len(explicit_args) == non_def_args
+    try:
+        return _num_non_default_args(fn) == non_def_args
+    except TypeError:
+        # Unhashable callable; we cannot cache its signature
+        return _num_non_default_args.__wrapped__(fn) == non_def_args
+
+
+@functools.lru_cache(maxsize=4096)
+def _num_non_default_args(fn):
+    return sum(1 for p in inspect.signature(fn).parameters.values()
+               if p.default is p.empty)
+
+
+# NOTE: The set of types is copied from the copy.deepcopy() implementation
+_BUILTIN_TYPES = frozenset({
+    type(None), int, float, bool, complex, str, tuple, bytes, frozenset,
+    type, range, slice, property, type(Ellipsis), type(NotImplemented),
+    weakref.ref, types.BuiltinFunctionType, types.FunctionType
+})
 
 
 def _is_builtin_type(cls):
-    # NOTE: The set of types is copied from the copy.deepcopy() implementation
-    builtin_types = (type(None), int, float, bool, complex, str, tuple,
-                     bytes, frozenset, type, range, slice, property,
-                     type(Ellipsis), type(NotImplemented), weakref.ref,
-                     types.BuiltinFunctionType, types.FunctionType)
+    return isinstance(cls, type) and cls in _BUILTIN_TYPES
 
-    if not isinstance(cls, type):
-        return False
 
-    return any(t == cls for t in builtin_types)
+_FUNCTION_TYPES = (types.BuiltinFunctionType, types.FunctionType)
 
 
 def _is_function_type(cls):
-    return (isinstance(cls, types.BuiltinFunctionType) or
-            isinstance(cls, types.FunctionType))
+    return isinstance(cls, _FUNCTION_TYPES)
 
 
 def attr_validator(validate_fn):
@@ -451,98 +508,66 @@ def attr_validator(validate_fn):
 
     '''
 
-    # Already visited objects
-    visited = set()
-    depth = 0
-
-    def _do_validate(obj, path=None):
-        def _fmt(path):
-            ret = ''
-            for p in path:
-                t, name = p
-                if t == 'A':
-                    ret += f'.{name}'
-                elif t == 'I':
-                    ret += f'[{name}]'
-                elif t == 'K':
-                    ret += f'[{name!r}]'
-
-            # Remove leading '.'
-            return ret[1:] if ret[0] == '.' else ret
-
-        nonlocal depth
-
-        def _clean_cache():
-            nonlocal depth
-
-            depth -= 1
-            if depth == 0:
-                # We are exiting the top-level call
-                visited.clear()
-
-        depth += 1
-        visited.add(id(obj))
-        if path is None:
-            path = [('A', type(obj).__name__)]
-
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                if id(v) in visited:
-                    continue
+    def _fmt(path):
+        # Paths are linked `(parent, (type, name))` nodes; collect the path
+        # elements from the leaf upwards
+        elems = []
+        while path is not None:
+            path, elem = path
+            elems.append(elem)
+
+        parts = []
+        for t, name in reversed(elems):
+            if t == 'A':
+                parts.append(f'.{name}')
+            elif t == 'I':
+                parts.append(f'[{name}]')
+            elif t == 'K':
+                parts.append(f'[{name!r}]')
+
+        # Remove leading '.'
+        ret = ''.join(parts)
+        return ret[1:] if ret[0] == '.' else ret
+
+    def _do_validate(obj):
+        # Validate the object graph depth-first using an explicit stack of
+        # `(obj, path)` entries; objects are checked against the already
+        # visited ones when they are popped, so that the traversal order is
+        # that of a recursive descent. Paths share their common prefix and
+        # they are only formatted if the validation fails.
+        root_name = type(obj).__name__
+        visited = set()
+        stack = [(obj, (None, ('A', root_name)))]
+        while stack:
+            obj, path = stack.pop()
+            if id(obj) in visited:
+                continue
 
-                path.append(('K', k))
-                valid, _ = _do_validate(v, path)
-                if not valid:
-                    _clean_cache()
+            visited.add(id(obj))
+            if isinstance(obj, dict):
+                children = [(v, (path, ('K', k)))
+                            for k, v in obj.items() if id(v) not in visited]
+            elif isinstance(obj, (list, tuple, set)):
+                children = [(x, (path, ('I', i)))
+                            for i, x in enumerate(obj) if id(x) not in visited]
+            else:
+                if not validate_fn(obj):
                     return False, _fmt(path)
 
-                path.pop()
-
-            _clean_cache()
-            return True, _fmt(path)
-
-        if (isinstance(obj, list) or
-            isinstance(obj, tuple) or
-            isinstance(obj, set)):
-            for i, x in enumerate(obj):
-                if id(x) in visited:
+                # Stop here if obj is a built-in type
+                if isinstance(obj, type) and _is_builtin_type(obj):
                     continue
 
-                path.append(('I', i))
-                valid, _ = _do_validate(x, path)
-                if not valid:
-                    _clean_cache()
-                    return False, _fmt(path)
-
-                path.pop()
-
-            _clean_cache()
-            return True, _fmt(path)
-
-        valid = validate_fn(obj)
-        if not valid:
-            _clean_cache()
-            return False, _fmt(path)
-
-        # Stop here if obj is a built-in type
-        if isinstance(obj, type) and _is_builtin_type(obj):
-            return True, _fmt(path)
-
-        if hasattr(obj, '__dict__'):
-            for k, v in obj.__dict__.items():
-                if id(v) in visited:
+                if not hasattr(obj, '__dict__'):
                     continue
 
-                path.append(('A', k))
-                valid, _ = _do_validate(v, path)
-                if not valid:
-                    _clean_cache()
-                    return False, _fmt(path)
+                children = [(v, (path, ('A', k)))
+                            for k, v in obj.__dict__.items()
+                            if id(v) not in visited]
 
-                path.pop()
+            stack += reversed(children)
 
-        _clean_cache()
-        return True, _fmt(path)
+        return True, root_name
 
     return _do_validate
 
@@ -563,7 +588,8 @@ def is_copyable(obj):
 
     '''
 
-    if hasattr(obj, '__copy__') or hasattr(obj, '__deepcopy__'):
+    if (getattr(obj, '__copy__', None) is not None or
+        getattr(obj, '__deepcopy__', None) is not None):
         return True
 
     if _is_function_type(obj):
@@ -585,16 +611,18 @@ def is_picklable(obj):
     if isinstance(obj, type):
         return False
 
-    if hasattr(obj, '__reduce_ex__'):
+    reduce_ex = getattr(obj, '__reduce_ex__', None)
+    if reduce_ex is not None:
         try:
-            obj.__reduce_ex__(4)
+            reduce_ex(4)
             return True
         except TypeError:
             return False
 
-    if hasattr(obj, '__reduce__'):
+    reduce = getattr(obj, '__reduce__', None)
+    if reduce is not None:
         try:
-            obj.__reduce__()
+            reduce()
             return True
         except TypeError:
             return False
@@ -615,19 +643,11 @@ def shortest(*iterables):
     .. |Sized| replace:: :class:`Sized`
     '''
 
-    ret = None
     for seq in iterables:
         if not isinstance(seq, collections.abc.Sized):
             raise TypeError(f'expected a sized iterable: {seq}')
 
-        if ret is None:
-            ret = seq
-            continue
-
-        if len(seq) < len(ret):
-            ret = seq
-
-    return ret
+    return min(iterables, key=len, default=None)
 
 
 def longest(*iterables):
@@ -641,19 +661,11 @@ def longest(*iterables):
 
     '''
 
-    ret = None
     for seq in iterables:
         if not isinstance(seq, collections.abc.Sized):
             raise TypeError(f'expected a sized iterable: {seq}')
 
-        if ret is None:
-            ret = seq
-            continue
-
-        if len(seq) > len(ret):
-            ret = seq
-
-    return ret
+    return max(iterables, key=len, default=None)
 
 
 def find_modules(substr, environ_mapping=None):
@@ -731,12 +743,16 @@ def find_modules(substr, environ_mapping=None):
             "'environ_mapping' argument must be of type Dict[str,str]"
         )
 
+    if environ_mapping is not None:
+        environ_mapping = [(re.compile(patt), env)
+                           for patt, env in environ_mapping.items()]
+
     def _is_valid_for_env(m, e):
         if environ_mapping is None:
             return True
 
-        for patt, env in environ_mapping.items():
-            if re.match(patt, m) and e == env:
+        for patt, env in environ_mapping:
+            if e == env and patt.match(m):
                 return True
 
         return False
@@ -760,12 +776,10 @@ def count_digits(n):
     :meta private:
     '''
 
-    num_digits = 1
-    while n >= 10:
-        n /= 10
-        num_digits += 1
+    if n < 10:
+        return 1
 
-    return num_digits
+    return len(str(int(n)))
 
 
 def nodelist_abbrev(nodes):
@@ -775,13 +789,22 @@ def nodelist_abbrev(nodes):
     if not isinstance(nodes, collections.abc.Sequence):
         raise TypeError('nodes argument must be a Sequence')
 
-    ns = NodeSet.fromlist(nodes)
-    return str(ns)
+    return _nodelist_abbrev(tuple(nodes))
+
+
+@functools.lru_cache(maxsize=1024)
+def _nodelist_abbrev(nodes):
+    return str(NodeSet.fromlist(nodes))
 
 
 def nodelist_expand(nodespec):
+    return list(_nodelist_expand(nodespec))
+
+
+@functools.lru_cache(maxsize=1024)
+def _nodelist_expand(nodespec):
     try:
-        return list(NodeSet(nodespec))
+        return tuple(NodeSet(nodespec))
     except NodeSetParseError as err:
         raise ValueError('invalid nodespec') from err
 
@@ -793,15 +816,17 @@ def cache_return_value(fn):
     returned each time.
     '''
 
-    undefined = []  # Any mutable object should do the job
+    undefined = object()
     cached = undefined
 
+    @functools.wraps(fn)
     def _replace_fn(*args, **kwargs):
         nonlocal cached
 
-        if cached is undefined:
-            cached = fn(*args, **kwargs)
+        if cached is not undefined:
+            return cached
 
+        cached = fn(*args, **kwargs)
         return cached
 
     return _replace_fn
@@ -829,14 +854,18 @@ class temp_sys_path:
 
     def __init__(self, path):
         self._path = path
-        self._pos = None
 
     def __enter__(self):
-        self._pos = len(sys.path)
         sys.path.append(self._path)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.path.pop(self._pos)
+        # Remove the last occurrence of our entry by value, since `sys.path`
+        # may have been modified inside the context; any other modifications
+        # are kept, as they may be needed by the modules imported meanwhile
+        for i in range(len(sys.path) - 1, -1, -1):
+            if sys.path[i] == self._path:
+                del sys.path[i]
+                break
 
 
 class ScopedDict(UserDict):
@@ -900,7 +929,13 @@ class ScopedDict(UserDict):
     def __init__(self, mapping={}, scope_sep=':', global_scope='*'):
         super().__init__(mapping)
         self._scope_sep = scope_sep
-        self._global_scope = global_scope
+        self._global_scope = sys.intern(global_scope)
+
+        # Scope resolution chains indexed by scope name
+        self._scope_chains = {}
+
+        # Scope and key pairs indexed by the full key name
+        self._keyinfo_cache = {}
 
     @property
     def scope_separator(self):
@@ -918,15 +953,20 @@ class ScopedDict(UserDict):
 
         :arg other: A two-level mapping defining scopes and keys.
         '''
-        if not isinstance(other, collections.abc.Mapping):
+        if isinstance(other, ScopedDict):
+            # The scopes of another scoped dictionary are already checked
+            scopes = other.data.items()
+        elif isinstance(other, collections.abc.Mapping):
+            scopes = other.items()
+            for scope, scope_dict in scopes:
+                self._check_scope_type(scope, scope_dict)
+        else:
             raise TypeError('ScopedDict may only be initialized '
                             'from a mapping type')
 
-        for scope, scope_dict in other.items():
-            self._check_scope_type(scope, scope_dict)
-            self.data.setdefault(scope, {})
-            for k, v in scope_dict.items():
-                self.data[scope][k] = v
+        for scope, scope_dict in scopes:
+            scope = sys.intern(str(scope))
+            self.data.setdefault(scope, {}).update(scope_dict)
 
     def scope(self, name):
         '''Retrieve a whole scope.
@@ -937,18 +977,12 @@ class ScopedDict(UserDict):
         '''
 
         ret = {}
-        curr_scope = name
-        while curr_scope is not None:
-            if curr_scope in self.data:
-                for k, v in self.data[curr_scope].items():
+        for scope in self._scope_chain(name):
+            if scope in self.data:
+                for k, v in self.data[scope].items():
                     if k not in ret:
                         ret[k] = v
 
-            if curr_scope == self._global_scope:
-                curr_scope = None
-            else:
-                curr_scope = self._parent_scope(curr_scope)
-
         return ret
 
     def __str__(self):
@@ -962,39 +996,74 @@ class ScopedDict(UserDict):
         if not isinstance(value, collections.abc.Mapping):
             raise TypeError('scope namespaces must be mappings')
 
-        for k in value.keys():
-            if not isinstance(k, str):
-                raise TypeError('keys must be strings')
+        if not all(isinstance(k, str) for k in value.keys()):
+            raise TypeError('keys must be strings')
 
     def _keyinfo(self, key):
+        try:
+            return self._keyinfo_cache[key]
+        except KeyError:
+            pass
+
+        # Scope names are interned, since they are used repeatedly as keys
+        # of the scope dictionaries
         key_parts = key.rsplit(self._scope_sep, maxsplit=1)
         if len(key_parts) == 2:
-            return (key_parts[0], key_parts[1])
+            ret = (sys.intern(key_parts[0]), key_parts[1])
         else:
-            return (self._global_scope, key_parts[0])
+            ret = (self._global_scope, key_parts[0])
+
+        self._keyinfo_cache[key] = ret
+        return ret
 
     def _parent_scope(self, scope):
-        scope_parts = scope.rsplit(':', maxsplit=1)[:-1]
-        return scope_parts[0] if scope_parts else self._global_scope
+        pos = scope.rfind(':')
+        return scope[:pos] if pos != -1 else self._global_scope
+
+    def _scope_chain(self, scope):
+        # Return the scopes to search for `scope` starting from the
+        # innermost one and ending at the global scope
+        try:
+            return self._scope_chains[scope]
+        except KeyError:
+            pass
+
+        chain = []
+        curr_scope = scope
+        while curr_scope is not None:
+            chain.append(curr_scope)
+            if curr_scope == self._global_scope:
+                curr_scope = None
+            else:
+                curr_scope = self._parent_scope(curr_scope)
+
+        chain = self._scope_chains[scope] = tuple(chain)
+        return chain
 
     def _lookup(self, key):
-        scope, lookup_key = self._keyinfo(key)
-        while scope != self._global_scope:
-            if scope in self.data and lookup_key in self.data[scope]:
-                return self.data[scope][lookup_key]
+        data = self.data
+        if self._scope_sep not in key:
+            # Fast path for keys in the global scope
+            scope_dict = data.get(self._global_scope)
+            if scope_dict is not None and key in scope_dict:
+                return scope_dict[key]
 
-            scope = self._parent_scope(scope)
+            raise KeyError(str(key))
 
-        # last chance to find the key
-        if scope in self.data and lookup_key in self.data[scope]:
-            return self.data[scope][lookup_key]
+        scope, lookup_key = self._keyinfo(key)
+        for scope in self._scope_chain(scope):
+            scope_dict = data.get(scope)
+            if scope_dict is not None and lookup_key in scope_dict:
+                return scope_dict[lookup_key]
 
         raise KeyError(str(key))
 
     def __iter__(self):
+        sep = self._scope_sep
         for scope, scope_dict in self.data.items():
-            for k in scope_dict.keys():
-                yield self._scope_sep.join([scope, k])
+            prefix = scope + sep
+            for k in scope_dict:
+                yield prefix + k
 
     def __contains__(self, key):
         try:
@@ -1005,6 +1074,10 @@ class ScopedDict(UserDict):
             return True
 
     def __getitem__(self, key):
+        if type(self).__missing__ is ScopedDict.__missing__:
+            # Our __missing__() would only raise the same error again
+            return self._lookup(key)
+
         try:
             return self._lookup(key)
         except KeyError:
@@ -1012,11 +1085,9 @@ class ScopedDict(UserDict):
 
     def __setitem__(self, key, value):
         scope, lookup_key = self._keyinfo(key)
-        if scope not in self.data:
-            # create the scope if does not exist
-            self.data[scope] = {}
 
-        self.data[scope][lookup_key] = value
+        # Create the scope if it does not exist
+        self.data.setdefault(scope, {})[lookup_key] = value
 
     def __delitem__(self, key):
         '''Deletes either a key or a scope if key refers to a scope.
@@ -1026,8 +1097,9 @@ class ScopedDict(UserDict):
         If not, the exact key requested will be deleted.
         No key resolution will be performed.'''
         scope, lookup_key = self._keyinfo(key)
-        if scope in self.data and lookup_key in self.data[scope]:
-            del self.data[scope][lookup_key]
+        scope_dict = self.data.get(scope)
+        if scope_dict is not None and lookup_key in scope_dict:
+            del scope_dict[lookup_key]
         elif key in self.data:
             # key is a scope
             del self.data[key]
@@ -1071,11 +1143,9 @@ class OrderedSet(collections.abc.MutableSet):
             raise TypeError("'%s' object is not iterable" %
                             type(iterable).__name__)
 
-        # We implement an ordered set through the keys of an OrderedDict;
-        # its values are all set to None
-        self.__data = collections.OrderedDict(
-            itertools.zip_longest(iterable, [], fillvalue=None)
-        )
+        # We implement an ordered set through the keys of a dictionary, which
+        # preserves their insertion order; its values are all set to None
+        self.__data = dict.fromkeys(iterable)
 
     def __repr__(self):
         vals = self.__data.keys()
@@ -1097,16 +1167,12 @@ class OrderedSet(collections.abc.MutableSet):
     # Set i/face
     def __eq__(self, other):
         if isinstance(other, OrderedSet):
-            if len(self) != len(other):
+            if len(self.__data) != len(other.__data):
                 return False
 
-            for x, y in zip(self, other):
-                if x != y:
-                    return False
-
-            return True
+            return list(self.__data) == list(other.__data)
         elif isinstance(other, collections.abc.Set):
-            return set(self.__data.keys()) == other
+            return self.__data.keys() == other
         else:
             return NotImplemented
 
@@ -1114,17 +1180,20 @@ class OrderedSet(collections.abc.MutableSet):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        return set(self.__data.keys()) > other
+        return self.__data.keys() > other
 
     def __and__(self, other):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        ret = type(self)()
-        for x in shortest(self, other):
-            if x in self and x in other:
-                ret.add(x)
+        # Iterate over the shortest operand and look up the longest one
+        if len(self.__data) <= len(other):
+            small, large = self.__data, other
+        else:
+            small, large = other, self.__data
 
+        ret = type(self)()
+        ret.__data = {x: None for x in small if x in large}
         return ret
 
     def __or__(self, other):
@@ -1132,20 +1201,16 @@ class OrderedSet(collections.abc.MutableSet):
             return NotImplemented
 
         ret = type(self)()
-        for x in itertools.chain(self, other):
-            ret.add(x)
-
+        ret.__data = self.__data.copy()
+        ret.__data.update(dict.fromkeys(other))
         return ret
 
     def __sub__(self, other):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        ret = type(self)(self.__data.keys())
-        for x in other:
-            if x in ret:
-                ret.remove(x)
-
+        ret = type(self)()
+        ret.__data = {x: None for x in self.__data if x not in other}
         return ret
 
     def __xor__(self, other):
@@ -1167,7 +1232,7 @@ class OrderedSet(collections.abc.MutableSet):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        return set(self.__data.keys()).isdisjoint(other)
+        return self.__data.keys().isdisjoint(other)
 
     def issubset(self, other):
         '''See same method in :py:class:`set`.'''
@@ -1226,10 +1291,7 @@ class OrderedSet(collections.abc.MutableSet):
     def discard(self, elem):
         '''See same method in :py:class:`set`.'''
 
-        try:
-            self.remove(elem)
-        except KeyError:
-            pass
+        self.__data.pop(elem, None)
 
     def pop(self):
         '''See same method in :py:class:`set`.'''
@@ -1254,18 +1316,20 @@ class OrderedSet(collections.abc.MutableSet):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        discard_list = [e for e in self if e not in other]
-        for e in discard_list:
-            self.discard(e)
-
+        self.__data = {e: None for e in self.__data if e in other}
         return self
 
     def __isub__(self, other):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
+        if other is self:
+            self.__data.clear()
+            return self
+
+        data = self.__data
         for e in other:
-            self.discard(e)
+            data.pop(e, None)
 
         return self
 
@@ -1273,15 +1337,15 @@ class OrderedSet(collections.abc.MutableSet):
         if not isinstance(other, collections.abc.Set):
             return NotImplemented
 
-        discard_list = [e for e in self if e in other]
-        for e in discard_list:
-            self.discard(e)
-
+        data = self.__data
+        self.__data = {e: None for e in data if e not in other}
+        self.__data.update(dict.fromkeys(e for e in other if e not in data))
         return self
 
     # Other functions
     def __reversed__(self):
-        return reversed(self.__data.keys())
+        # Dictionaries are reversible only since Python 3.8
+        return reversed(list(self.__data))
 
 
 class SequenceView(collections.abc.Sequence):
@@ -1335,19 +1399,19 @@ class SequenceView(collections.abc.Sequence):
         return self.__container.index(value, start, stop)
 
     def __contains__(self, value):
-        return self.__container.__contains__(value)
+        return value in self.__container
 
     def __getitem__(self, index):
-        return self.__container.__getitem__(index)
+        return self.__container[index]
 
     def __iter__(self):
-        return self.__container.__iter__()
+        return iter(self.__container)
 
     def __len__(self):
-        return self.__container.__len__()
+        return len(self.__container)
 
     def __reversed__(self):
-        return self.__container.__reversed__()
+        return reversed(self.__container)
 
     def __add__(self, other):
         if not isinstance(other, type(self.__container)):
@@ -1416,16 +1480,16 @@ class MappingView(collections.abc.Mapping):
         return self.__mapping.values()
 
     def __contains__(self, key):
-        return self.__mapping.__contains__(key)
+        return key in self.__mapping
 
     def __getitem__(self, key):
-        return self.__mapping.__getitem__(key)
+        return self.__mapping[key]
 
     def __iter__(self):
-        return self.__mapping.__iter__()
+        return iter(self.__mapping)
 
     def __len__(self):
-        return self.__mapping.__len__()
+        return len(self.__mapping)
 
     def __eq__(self, other):
         if isinstance(other, MappingView):
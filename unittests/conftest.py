@@ -113,7 +113,7 @@ def make_runner(request):
     def _make_runner(*args, **kwargs):
         # Use a much higher poll rate for the unit tests
         policy = request.param()
-        policy._pollctl.SLEEP_MIN = 0.001
+        policy._pollctl._sleep_min = 0.001
         return executors.Runner(policy, *args, **kwargs)
 
     return _make_runner
@@ -123,7 +123,7 @@ def make_runner(request):
 def make_async_runner():
     def _make_runner(*args, **kwargs):
         policy = policies.AsynchronousExecutionPolicy()
-        policy._pollctl.SLEEP_MIN = 0.001
+        policy._pollctl._sleep_min = 0.001
         return executors.Runner(policy, *args, **kwargs)
 
     return _make_runner
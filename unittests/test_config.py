@@ -415,6 +415,18 @@ def test_multi_config_combine_general_options(write_config):
     assert site_config.get('general/0/colorize') is False
 
 
+@pytest.mark.parametrize('option,value', [('poll_backoff_base', 1),
+                                           ('poll_backoff_base', 0.5),
+                                           ('poll_backoff_min', 0),
+                                           ('poll_backoff_min', -1)])
+def test_validate_invalid_poll_backoff(write_config, option, value):
+    config_file = write_config({'general': [{option: value}]})
+    site_config = config.load_config(config_file)
+    with pytest.raises(ConfigError,
+                       match=r'could not validate configuration file'):
+        site_config.validate()
+
+
 def test_multi_config_combine_logging_options(write_config):
     config_file = write_config({'logging': [{'level': 'debug'}]})
     site_config = config.load_config(config_file)
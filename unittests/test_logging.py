@@ -555,3 +555,11 @@ def test_httpjson_handler_no_port(make_exec_ctx, config_file,
         })
     )
     rlog.configure_logging(rt.runtime().site_config)
+
+
+def test_logger_is_enabled_for(logger_without_check):
+    logger_without_check.setLevel(rlog.VERBOSE)
+    assert logger_without_check.isEnabledFor(rlog.INFO)
+    assert logger_without_check.isEnabledFor(rlog.VERBOSE)
+    assert not logger_without_check.isEnabledFor(rlog.DEBUG2)
+    assert not rlog.null_logger.isEnabledFor(rlog.CRITICAL)
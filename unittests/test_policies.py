@@ -716,6 +716,56 @@ def test_compile_fail_reschedule_busy_loop(make_async_runner, make_cases,
     assert num_checks == len(stats.failed())
 
 
+def test_partition_names_evicted(make_async_runner, make_cases,
+                                 common_exec_ctx):
+    runner, _ = make_async_runner()
+    runner.runall(make_cases())
+    assert_runall(runner)
+
+    # The cached partition names must not outlive the tasks
+    assert runner.policy._task_partnames == {}
+
+
+def test_poll_groups(make_async_runner, make_cases, make_sleep_check,
+                     make_exec_ctx, monkeypatch):
+    from reframe.core.schedulers.local import LocalJobScheduler
+
+    num_checks = 3
+    make_exec_ctx(options=max_jobs_opts(num_checks))
+    runner, _ = make_async_runner()
+
+    # Count the polling cycles of the policy and the number of jobs passed
+    # to every scheduler poll
+    num_cycles = 0
+    num_polled = []
+    poll_tasks = policies.AsynchronousExecutionPolicy._poll_tasks
+    poll_jobs = LocalJobScheduler.poll
+
+    def _poll_tasks(self):
+        nonlocal num_cycles
+        num_cycles += 1
+        return poll_tasks(self)
+
+    def _poll_jobs(self, *jobs):
+        num_polled.append(len(jobs))
+        return poll_jobs(self, *jobs)
+
+    monkeypatch.setattr(policies.AsynchronousExecutionPolicy, '_poll_tasks',
+                        _poll_tasks)
+    monkeypatch.setattr(LocalJobScheduler, 'poll', _poll_jobs)
+    runner.runall(make_cases([make_sleep_check(.5)
+                              for i in range(num_checks)]))
+    assert num_checks == runner.stats.num_cases()
+    assert_runall(runner)
+    assert 0 == len(runner.stats.failed())
+
+    # All the jobs share the same scheduler, so they must be polled together
+    # with a single call per cycle
+    assert len(runner.policy._poll_groups) == 1
+    assert 0 < len(num_polled) <= num_cycles
+    assert max(num_polled) == num_checks
+
+
 def test_config_params(make_runner, make_exec_ctx):
     '''Test that configuration parameters are properly retrieved with the
     various execution policies.
@@ -742,3 +792,87 @@ def test_config_params(make_runner, make_exec_ctx):
     runner.runall(testcases)
     assert runner.stats.num_cases() == 2
     assert not runner.stats.failed()
+
+
+def test_poll_controller_adaptive(common_exec_ctx, monkeypatch):
+    pollctl = policies._PollController()
+    pollctl.reset_snooze_time()
+
+    # Without enough samples the sleep time grows geometrically
+    monkeypatch.setattr(policies.time, 'sleep', lambda t: None)
+    sleep_min = pollctl._sleep_min
+    pollctl.snooze()
+    assert pollctl._sleep_duration == pytest.approx(
+        sleep_min*pollctl._sleep_inc_rate
+    )
+
+    # With enough samples, the polls are placed at the observed quantiles
+    for t in range(1, 101):
+        pollctl.record_completion(float(t))
+
+    pollctl.record_completion(None)
+    assert len(pollctl._samples) == 100
+
+    t_now = pollctl._t_reset
+    monkeypatch.setattr(policies.time, 'time', lambda: t_now)
+    pollctl.snooze()
+    poll_points = pollctl._poll_points
+    assert poll_points == sorted(poll_points)
+    assert poll_points[-1] <= 100
+    assert pollctl._sleep_duration == pytest.approx(poll_points[0])
+
+    # Past the last poll point, we fall back to the geometric backoff
+    monkeypatch.setattr(policies.time, 'time', lambda: t_now + 1000)
+    sleep_prev = pollctl._sleep_duration
+    pollctl.snooze()
+    assert pollctl._sleep_duration == pytest.approx(
+        min(sleep_prev*pollctl._sleep_inc_rate, pollctl.SLEEP_MAX)
+    )
+
+
+def test_poll_controller_samples(make_runner, make_cases, common_exec_ctx):
+    runner = make_runner()
+    runner.runall(make_cases())
+
+    # Only the serial policy polls a single job after each reset, so only
+    # this one may place its polls adaptively
+    samples = runner.policy._pollctl._samples
+    if isinstance(runner.policy, policies.SerialExecutionPolicy):
+        num_runs = sum(t.duration('run_complete') is not None
+                       for t in runner.stats.tasks())
+        assert len(samples) == num_runs
+    else:
+        assert samples == []
+
+
+def test_critical_path_priority(make_cases, common_exec_ctx):
+    import reframe.utility.sanity as sn
+
+    class _BaseTest(rfm.RunOnlyRegressionTest):
+        valid_systems = ['*']
+        valid_prog_environs = ['*']
+        executable = 'echo'
+        sanity_patterns = sn.assert_true(1)
+
+    class _T0(_BaseTest):
+        pass
+
+    class _T1(_BaseTest):
+        pass
+
+    class _T2(_BaseTest):
+        def __init__(self):
+            self.depends_on('_T1')
+
+    class _T3(_BaseTest):
+        def __init__(self):
+            self.depends_on('_T2')
+
+    runner = executors.Runner(policies.AsynchronousExecutionPolicy())
+    policy = runner.policy
+    policy.enter()
+    for c in make_cases([_T0(), _T1(), _T2(), _T3()], sort=True):
+        policy.runcase(c)
+
+    policy._prioritize_tasks()
+    assert ['_T1', '_T0'] == [t.check.name for t in policy._active_tasks]
@@ -3,9 +3,11 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import fcntl
 import os
 import pytest
 import re
+import resource
 import signal
 import socket
 import time
@@ -534,6 +536,62 @@ def test_submit_timelimit(minimal_job, local_only):
         assert minimal_job.state == 'TIMEOUT'
 
 
+def test_block_local(minimal_job, local_only):
+    prepare_job(minimal_job, 'sleep 1')
+    submit_job(minimal_job)
+    t_start = time.time()
+    minimal_job.scheduler.block(minimal_job, 10)
+    assert time.time() - t_start < 10
+
+    # The job must not have been reaped by blocking on it
+    minimal_job.wait()
+    assert minimal_job.state == 'SUCCESS'
+
+
+def test_block_local_high_fd(minimal_job, local_only, monkeypatch):
+    if not hasattr(os, 'pidfd_open'):
+        pytest.skip('process file descriptors not supported')
+
+    # Make sure that process file descriptors beyond FD_SETSIZE are handled;
+    # we raise the soft limit of open files if needed to allocate one
+    fd_setsize = 1024
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft <= fd_setsize:
+        if hard == resource.RLIM_INFINITY or hard > 2*fd_setsize:
+            new_soft = 2*fd_setsize
+        elif hard > fd_setsize:
+            new_soft = hard
+        else:
+            pytest.skip('cannot allocate file descriptors beyond FD_SETSIZE')
+
+        resource.setrlimit(resource.RLIMIT_NOFILE, (new_soft, hard))
+
+    pidfd_open = os.pidfd_open
+    pidfds = []
+
+    def _pidfd_open(pid):
+        fd = pidfd_open(pid)
+        try:
+            # Duplicate to the lowest free descriptor beyond FD_SETSIZE
+            pidfds.append(fcntl.fcntl(fd, fcntl.F_DUPFD, fd_setsize))
+            return pidfds[-1]
+        finally:
+            os.close(fd)
+
+    monkeypatch.setattr(os, 'pidfd_open', _pidfd_open)
+    try:
+        prepare_job(minimal_job, 'sleep 1')
+        submit_job(minimal_job)
+        t_start = time.time()
+        minimal_job.scheduler.block(minimal_job, 10)
+        assert time.time() - t_start < 10
+        assert pidfds and pidfds[0] >= fd_setsize
+        minimal_job.wait()
+        assert minimal_job.state == 'SUCCESS'
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+
 def test_submit_unqualified_hostnames(make_exec_ctx, make_job, local_only):
     make_exec_ctx(
         system='testsys',
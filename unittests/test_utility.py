@@ -3,6 +3,7 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import copy
 import os
 import pytest
 import random
@@ -719,6 +720,19 @@ def test_import_from_file_load_twice():
     assert module1 is module2
 
 
+def test_import_from_file_load_uncached(tmp_path):
+    test_file = tmp_path / 'foo.py'
+    with open(test_file, 'w') as fp:
+        print('var = 1', file=fp)
+
+    module1 = util.import_module_from_file(test_file)
+    del sys.modules[module1.__name__]
+    module2 = util.import_module_from_file(test_file)
+    assert module1 is not module2
+    assert module2 is sys.modules[module2.__name__]
+    assert module2 is util.import_module_from_file(test_file)
+
+
 def test_import_from_file_load_namespace_package():
     util.import_module_from_file('unittests/resources')
     assert 'unittests' in sys.modules
@@ -844,6 +858,16 @@ def test_ppretty_obj_print():
                                               "]")
 
 
+def test_ppretty_deeply_nested():
+    depth = sys.getrecursionlimit() + 10
+    value = []
+    for _ in range(depth):
+        value = [value]
+
+    s = util.ppretty(value, lfchar='', indent=0)
+    assert s == '[' * depth + '[]' + ']' * depth
+
+
 class _X:
     def __init__(self):
         self._a = False
@@ -877,6 +901,9 @@ def test_repr_default():
     }})@{hex(id(c1))}
 ]'''
 
+    # Objects are tracked per call
+    assert util.repr([c0, c1]) == s
+
 
 def test_attrs():
     class B:
@@ -1178,6 +1205,9 @@ def test_scoped_dict_key_resolution():
     assert scoped_dict.scope('a:b:c') == {'k1': 3, 'k2': 5, 'k3': 6, 'k4': 10}
     assert scoped_dict.scope('*') == {'k1': 7, 'k3': 9, 'k4': 10}
 
+    # Keys of inner scopes are listed first
+    assert list(scoped_dict.scope('a:b')) == ['k1', 'k3', 'k2', 'k4']
+
     # This is resolved in scope 'a'
     assert scoped_dict.scope('a:z') == {'k1': 1, 'k2': 2, 'k3': 9, 'k4': 10}
     assert scoped_dict.scope(None) == {}
@@ -1202,6 +1232,26 @@ def test_scoped_dict_setitem():
     assert 50 == scoped_dict['k5']
     assert 60 == scoped_dict['k6']
 
+    # Check that updates are visible to repeated lookups of the same key
+    key = 'a:b:k2'
+    assert 20 == scoped_dict[key]
+    scoped_dict['a:b:k2'] = 70
+    assert 70 == scoped_dict[key]
+    del scoped_dict['a:b:k2']
+    assert 20 == scoped_dict[key]
+    scoped_dict.update({'a': {'k2': 80}})
+    assert 80 == scoped_dict[key]
+
+    # Check that updates through a shallow copy, which shares the scopes with
+    # the original dictionary, are visible to repeated lookups of the same key
+    key = 'a:k1'
+    assert 1 == scoped_dict[key]
+    scoped_dict_copy = copy.copy(scoped_dict)
+    scoped_dict_copy['a:k1'] = 90
+    assert 90 == scoped_dict[key]
+    scoped_dict.data['a']['k1'] = 100
+    assert 100 == scoped_dict[key]
+
 
 def test_scoped_dict_delitem():
     scoped_dict = reframe.utility.ScopedDict({
@@ -1276,6 +1326,12 @@ def test_scoped_dict_update():
     })
     assert scoped_dict == scoped_dict_alt
 
+    # Update from another scoped dictionary
+    scoped_dict_alt = util.ScopedDict({'a': {'k1': 3, 'k2': 5}})
+    scoped_dict_alt.update(scoped_dict)
+    assert scoped_dict == scoped_dict_alt
+    assert util.ScopedDict(scoped_dict) == scoped_dict
+
 
 def test_scoped_dict_json_enc():
     import json
@@ -1429,6 +1485,15 @@ def test_longest_sequence():
         util.longest([1], 2)
 
 
+def test_count_digits():
+    assert util.count_digits(0) == 1
+    assert util.count_digits(9) == 1
+    assert util.count_digits(10) == 2
+    assert util.count_digits(999) == 3
+    assert util.count_digits(1000) == 4
+    assert util.count_digits(10**20) == 21
+
+
 def test_ordered_set_construction(random_seed):
     l = list(range(10))
     random.shuffle(l)
@@ -1508,6 +1573,32 @@ def test_ordered_set_operators():
     assert s0.symmetric_difference(s1) == s2
 
 
+def test_ordered_set_inplace_operators():
+    s0 = util.OrderedSet('abcd')
+    s0 &= util.OrderedSet('dcx')
+    assert list(s0) == ['c', 'd']
+
+    s0 = util.OrderedSet('abcd')
+    s0 ^= util.OrderedSet('xdcy')
+    assert list(s0) == ['a', 'b', 'x', 'y']
+
+    s0 = util.OrderedSet('abcd')
+    s0 ^= s0
+    assert s0 == set()
+
+    s0 = util.OrderedSet('abcd')
+    s0 -= util.OrderedSet('xdb')
+    assert list(s0) == ['a', 'c']
+
+    s0 -= s0
+    assert s0 == set()
+
+    s0 = util.OrderedSet('abcd')
+    s0.discard('x')
+    s0.discard('a')
+    assert list(s0) == ['b', 'c', 'd']
+
+
 def test_ordered_set_union(random_seed):
     l0 = list(range(10))
     l1 = list(range(10, 20))
@@ -1929,6 +2020,33 @@ def test_attr_validator():
     has_no_c = util.attr_validator(lambda x: not isinstance(x, C))
     assert has_no_c(d) == (False, 'D.y')
 
+    # Check deeply nested objects
+    d.y.y = []
+    for _ in range(sys.getrecursionlimit()):
+        d.y.y = [d.y.y]
+
+    assert has_no_str(d) == (True, 'D')
+
+
+def test_attr_validator_views():
+    class X:
+        def __reduce_ex__(self, proto):
+            raise TypeError
+
+    class T:
+        def __init__(self):
+            self.v = util.SequenceView([1])
+            self.m = util.MappingView({'a': 1})
+
+    is_copyable = util.attr_validator(util.is_copyable)
+    t = T()
+    assert is_copyable(t) == (True, 'T')
+    t.v = util.SequenceView([1, X()])
+    assert is_copyable(t) == (False, 'T.v._SequenceView__container[1]')
+    t.v = util.SequenceView([1])
+    t.m = util.MappingView({'a': X()})
+    assert is_copyable(t) == (False, "T.m._MappingView__mapping['a']")
+
 
 def test_is_picklable():
     class X:
@@ -2008,6 +2126,14 @@ def test_is_trivially_callable():
     with pytest.raises(TypeError):
         util.is_trivially_callable(1)
 
+    class _Unhashable:
+        __hash__ = None
+
+        def __call__(self, x):
+            pass
+
+    assert util.is_trivially_callable(_Unhashable(), non_def_args=1)
+
 
 def test_nodelist_utilities():
     nid_nodes = [f'nid{n:03}' for n in range(5, 20)]
@@ -2117,3 +2243,18 @@ def test_cached_return_value():
     t_elapsed = time.time() - t_start
     assert r == 10
     assert t_elapsed >= 0.2 and t_elapsed < 0.4
+
+
+def test_temp_sys_path(tmp_path):
+    saved_path = list(sys.path)
+    with util.temp_sys_path(str(tmp_path)):
+        assert sys.path[-1] == str(tmp_path)
+
+        # Modifications of the path inside the context must be kept
+        sys.path.insert(0, 'foo')
+        sys.path.append('bar')
+
+    try:
+        assert sys.path == ['foo'] + saved_path + ['bar']
+    finally:
+        sys.path[:] = saved_path